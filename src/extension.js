@@ -1534,7 +1534,7 @@ function collectSdocFiles(rootDir) {
     }
     for (const entry of entries) {
       if (entry.isDirectory()) {
-        if (!SITE_EXCLUDE_DIRS.has(entry.name)) {
+        if (!entry.name.startsWith(".") && !SITE_EXCLUDE_DIRS.has(entry.name)) {
           walk(path.join(dir, entry.name));
         }
       } else if (entry.isFile() && entry.name.endsWith(".sdoc")) {
@@ -1727,6 +1727,8 @@ function handleRequest(req, res, rootDir) {
     serveFile(res, path.join(__dirname, "site-template", "index.html"), "text/html");
   } else if (pathname === "/viewer.css") {
     serveFile(res, path.join(__dirname, "site-template", "viewer.css"), "text/css");
+  } else if (pathname === "/viewer.js") {
+    serveFile(res, path.join(__dirname, "site-template", "viewer.js"), "application/javascript");
   } else if (pathname === "/sdoc-web.js") {
     serveSdocWebJs(res);
   } else if (pathname === "/api/manifest") {
@@ -1,18 +1,39 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import http.server
+import io
 import json
 import os
+import re
+import stat
 import sys
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
 
 CONFIG_FILENAME = "sdoc.config.json"
+# sdoc.js is a CommonJS module; give it a local `module` and publish its
+# exports as window.SDOC without touching the source itself.
+SDOC_WEB_PREFIX = b"(function (module) {\n"
+SDOC_WEB_SUFFIX = b"\nwindow.SDOC = module.exports;\n})({ exports: {} });\n"
+# Below this many documents, thread start-up costs more than it saves
+PARALLEL_MIN_FILES = 16
 EXCLUDE_DIRS = {".git", "node_modules", ".vscode", "_sdoc_site", "web", "out", "__pycache__"}
 
+_IDENT_PUNCT = str.maketrans("", "", "-_")
+_META_KV_RE = re.compile(r"^([\w][\w-]*)\s*:\s+(.+)$")
+
+# stylesheet path -> (is a file, stat key) for every path the last build checked
+_style_candidates: Dict[str, Tuple[bool, Optional[Tuple[int, int]]]] = {}
+# sdoc path -> ((mtime_ns, size), _scan_sdoc result) from earlier manifest builds
+_doc_cache: Dict[str, Tuple[Tuple[int, int], Tuple[str, Optional[str], List[str]]]] = {}
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_DIR = SCRIPT_DIR.parent
 
@@ -38,7 +59,7 @@ def find_site_template_dir(source_dir: Path) -> Path:
         REPO_DIR / "src" / "site-template",
     ]
     for candidate in candidates:
-        if (candidate / "viewer.css").exists() and (candidate / "index.html").exists():
+        if all((candidate / name).exists() for name in ("index.html", "viewer.css", "viewer.js")):
             return candidate
     print("Error: Could not find site-template directory", file=sys.stderr)
     print("Searched:", file=sys.stderr)
@@ -47,142 +68,161 @@ def find_site_template_dir(source_dir: Path) -> Path:
     sys.exit(1)
 
 
-def rel_posix(path: Path, root: Path) -> Optional[str]:
-    try:
-        return path.relative_to(root).as_posix()
-    except ValueError:
+def rel_posix(path: str, root: str) -> Optional[str]:
+    # Paths are built from the resolved root string, so a prefix check suffices
+    prefix = root.rstrip(os.sep) + os.sep
+    if not path.startswith(prefix):
         return None
+    return path[len(prefix):].replace(os.sep, "/")
 
 
-def read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
+def read_bytes(path: Union[str, Path]) -> bytes:
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+        # A short read only happens if the file grew or the OS capped it
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return data
 
 
-def is_heading_line(line: str) -> bool:
-    stripped = line.lstrip()
-    if stripped.startswith("\\#"):
-        return False
-    return stripped.startswith("#")
+def read_text(path: Union[str, Path]) -> str:
+    return read_bytes(path).decode("utf-8")
 
 
 def parse_heading(line: str) -> Tuple[str, Optional[str]]:
-    stripped = line.lstrip()
-    i = 0
-    while i < len(stripped) and stripped[i] == "#":
-        i += 1
-    raw = stripped[i:].strip()
+    # Callers pass a line that is already left-stripped and starts with "#"
+    raw = line.lstrip("#").strip()
 
     # trailing @id
-    title = raw
-    ident = None
-    parts = raw.split()
-    if parts and parts[-1].startswith("@") and len(parts[-1]) > 1:
-        if parts[-1][1:].replace("-", "").replace("_", "").isalnum():
-            ident = parts[-1][1:]
-            title = " ".join(parts[:-1]).strip()
-    return title, ident
-
-
-def extract_title(text: str) -> str:
-    for line in text.splitlines():
-        if is_heading_line(line):
-            title, _ = parse_heading(line)
-            if title:
-                return title
-    return "Untitled"
-
-
-def extract_meta_style_paths(text: str) -> Tuple[Optional[str], List[str]]:
-    lines = text.splitlines()
-    stack = []
+    parts = raw.rsplit(None, 1)
+    last = parts[-1] if parts else ""
+    if len(last) > 1 and last[0] == "@" and last[1:].translate(_IDENT_PUNCT).isalnum():
+        title = " ".join(parts[0].split()) if len(parts) == 2 else ""
+        return title, last[1:]
+    return raw, None
+
+
+# Shared by the manifest scan and /api/content, so a document read for the
+# manifest is served to the viewer from memory; the stamp keys out stale bytes.
+@functools.lru_cache(maxsize=256)
+def _read_sdoc_bytes(sdoc_path: str, mtime_ns: int, size: int) -> bytes:
+    return read_bytes(sdoc_path)
+
+
+# Built once per sdoc.js revision; the stamp keeps edits live without a restart.
+@functools.lru_cache(maxsize=1)
+def _sdoc_web_js_bytes(sdoc_js_path: str, mtime_ns: int, size: int) -> bytes:
+    return SDOC_WEB_PREFIX + read_bytes(sdoc_js_path) + SDOC_WEB_SUFFIX
+
+
+def scan_sdoc_file(sdoc_path: str) -> Tuple[str, Optional[str], List[str]]:
+    st = os.stat(sdoc_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _doc_cache.get(sdoc_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    result = _scan_sdoc(_read_sdoc_bytes(sdoc_path, *stamp).decode("utf-8"))
+    _doc_cache[sdoc_path] = (stamp, result)
+    return result
+
+
+def _apply_meta_child(key: str, lines: List[str], style_path: Optional[str],
+                      style_append_paths: List[str]) -> Optional[str]:
+    if not lines:
+        return style_path
+    if key == "style":
+        return lines[0]
+    if key in ("styleappend", "style-append"):
+        style_append_paths.extend(lines)
+    return style_path
+
+
+def _scan_sdoc(text: str) -> Tuple[str, Optional[str], List[str]]:
+    # Only the first top-level @meta scope matters, so track scope depth
+    # rather than building a tree, and stop once that scope has closed.
+    doc_title = None
+    depth = 0
     pending_heading = None
     code_fence = False
-    top_nodes = []
+    meta_state = None  # None: not seen, True: inside, False: closed
+    meta_lines: List[str] = []
+    child_key = None
+    child_lines: List[str] = []
+    style_path = None
+    style_append_paths: List[str] = []
 
-    for line in lines:
-        trimmed_left = line.lstrip()
-        trimmed = trimmed_left.strip()
+    # Lines are produced lazily so the early exit below skips the rest of
+    # the text; newline=None treats \r\n and \r as line breaks, as the JS parser does.
+    for line in io.StringIO(text, newline=None):
+        left = line.lstrip()
+        if not left:
+            continue
+        first = left[0]
 
-        if trimmed.startswith("```"):
+        if first == "`" and left.startswith("```"):
             code_fence = not code_fence
             continue
         if code_fence:
             continue
 
-        if trimmed == "":
-            if stack:
-                stack[-1]["paragraphs"].append("")
-            continue
-
-        if is_heading_line(trimmed_left):
+        if first == "#":
             # K&R: heading line ends with "{" — treat as heading + open brace
-            heading_text = trimmed_left
-            opens_brace = False
-            if trimmed.endswith("{"):
-                heading_text = trimmed_left.rstrip()[:-1]
-                opens_brace = True
-
-            pending_heading = parse_heading(heading_text)
-
-            if opens_brace and pending_heading:
-                title, ident = pending_heading
-                node = {"title": title, "id": ident, "children": [], "paragraphs": []}
-                if stack:
-                    stack[-1]["children"].append(node)
-                else:
-                    top_nodes.append(node)
-                stack.append(node)
-                pending_heading = None
-            continue
-
-        if trimmed == "{":
-            if pending_heading:
-                title, ident = pending_heading
-                node = {"title": title, "id": ident, "children": [], "paragraphs": []}
-                if stack:
-                    stack[-1]["children"].append(node)
-                else:
-                    top_nodes.append(node)
-                stack.append(node)
-                pending_heading = None
-            continue
-
-        if trimmed == "}":
-            if stack:
-                stack.pop()
+            left = left.rstrip()
+            opens_brace = left.endswith("{")
+            pending_heading = parse_heading(left[:-1] if opens_brace else left)
+            if doc_title is None and pending_heading[0]:
+                doc_title = pending_heading[0]
+            if not opens_brace:
+                continue
+        elif first in "{}" and not left[1:].strip():
+            if first == "}":
+                if depth:
+                    if meta_state and depth == 2:
+                        style_path = _apply_meta_child(child_key, child_lines, style_path, style_append_paths)
+                        child_key = None
+                    elif meta_state and depth == 1:
+                        meta_state = False
+                        if doc_title is not None:
+                            break
+                    depth -= 1
+                continue
+        else:
+            if meta_state:
+                if depth == 1:
+                    meta_lines.append(left.rstrip())
+                elif depth == 2:
+                    child_lines.append(left.rstrip())
             continue
 
-        if stack:
-            stack[-1]["paragraphs"].append(trimmed_left.strip())
-
-    meta_node = None
-    for node in top_nodes:
-        if (node.get("id") or "").lower() == "meta":
-            meta_node = node
-            break
-
-    if not meta_node:
-        return None, []
-
-    style_path = None
-    style_append_paths: List[str] = []
-
-    # First pass: sub-scope syntax (takes precedence)
-    for child in meta_node.get("children", []):
-        key = child.get("title", "").strip().lower()
-        text_lines = [line for line in child.get("paragraphs", []) if line.strip()]
-        if not text_lines:
-            continue
-        if key == "style":
-            style_path = text_lines[0].strip()
-        elif key in ("styleappend", "style-append"):
-            style_append_paths.extend([line.strip() for line in text_lines if line.strip()])
-
-    # Second pass: key:value syntax from paragraph lines (only if not already set)
-    import re
-    kv_pattern = re.compile(r"^([\w][\w-]*)\s*:\s+(.+)$")
-    for line in meta_node.get("paragraphs", []):
-        m = kv_pattern.match(line.strip())
+        if pending_heading:
+            title, ident = pending_heading
+            depth += 1
+            if depth == 1 and meta_state is None and (ident or "").lower() == "meta":
+                meta_state = True
+            elif meta_state and depth == 2:
+                child_key = title.strip().lower()
+                child_lines = []
+            pending_heading = None
+
+    if doc_title is None:
+        doc_title = "Untitled"
+
+    if meta_state is None:
+        return doc_title, None, []
+
+    # A child scope left open at end of file still counts
+    if meta_state and child_key is not None:
+        style_path = _apply_meta_child(child_key, child_lines, style_path, style_append_paths)
+
+    # key:value syntax from paragraph lines (only if not already set by a sub-scope)
+    for line in meta_lines:
+        m = _META_KV_RE.match(line)
         if not m:
             continue
         key = m.group(1).lower()
@@ -192,91 +232,163 @@ def extract_meta_style_paths(text: str) -> Tuple[Optional[str], List[str]]:
         elif key in ("styleappend", "style-append") and not style_append_paths:
             style_append_paths.append(value)
 
-    return style_path, style_append_paths
-
-
-def load_config_chain(file_path: Path, root_dir: Path) -> Dict:
-    start_dir = file_path.parent
-    chain = []
-    current = start_dir
-    while True:
-        cfg = current / CONFIG_FILENAME
-        if cfg.exists():
-            try:
-                data = json.loads(read_text(cfg))
-                chain.append((current, data))
-            except json.JSONDecodeError:
-                pass
-        if current == root_dir:
-            break
-        if current.parent == current:
-            break
-        current = current.parent
-
-    merged = {
-        "style": None,
-        "styleAppend": [],
-        "header": "",
-        "footer": ""
-    }
+    return doc_title, style_path, style_append_paths
 
-    for base_dir, data in reversed(chain):
-        if not isinstance(data, dict):
-            continue
-        style = data.get("style")
-        if isinstance(style, str):
-            merged["style"] = (base_dir / style).resolve()
 
-        style_append = data.get("styleAppend")
-        if style_append:
-            items = style_append if isinstance(style_append, list) else [style_append]
-            for item in items:
-                if isinstance(item, str):
-                    merged["styleAppend"].append((base_dir / item).resolve())
+def _load_raw_config(cfg_path: str) -> Optional[Dict]:
+    try:
+        st = os.stat(cfg_path)
+    except OSError:
+        return None
+    return _load_raw_config_cached(cfg_path, st.st_mtime_ns, st.st_size)
+
 
-        header = data.get("header")
-        if isinstance(header, str):
-            merged["header"] = header
+# Keyed by file stamp, so parsed configs survive across manifest builds and an
+# edited file simply misses; the bound drops entries for superseded stamps.
+@functools.lru_cache(maxsize=256)
+def _load_raw_config_cached(cfg_path: str, mtime_ns: int, size: int) -> Optional[Dict]:
+    try:
+        return json.loads(read_text(cfg_path))
+    except json.JSONDecodeError:
+        return None
 
-        footer = data.get("footer")
-        if isinstance(footer, str):
-            merged["footer"] = footer
+
+@functools.lru_cache(maxsize=None)
+def _config_for_dir(dir_path: str, root_dir: str) -> Dict:
+    parent_dir = os.path.dirname(dir_path)
+    if dir_path == root_dir or parent_dir == dir_path:
+        merged = {
+            "style": None,
+            "styleAppend": [],
+            "header": "",
+            "footer": ""
+        }
+    else:
+        parent = _config_for_dir(parent_dir, root_dir)
+        merged = dict(parent, styleAppend=list(parent["styleAppend"]))
+
+    data = _load_raw_config(os.path.join(dir_path, CONFIG_FILENAME))
+    if not isinstance(data, dict):
+        return merged
+
+    style = data.get("style")
+    if isinstance(style, str):
+        merged["style"] = os.path.normpath(os.path.join(dir_path, style))
+
+    style_append = data.get("styleAppend")
+    if style_append:
+        items = style_append if isinstance(style_append, list) else [style_append]
+        for item in items:
+            if isinstance(item, str):
+                merged["styleAppend"].append(os.path.normpath(os.path.join(dir_path, item)))
+
+    header = data.get("header")
+    if isinstance(header, str):
+        merged["header"] = header
+
+    footer = data.get("footer")
+    if isinstance(footer, str):
+        merged["footer"] = footer
 
     return merged
 
 
-def collect_sdoc_files(root: Path) -> List[Path]:
-    results = []
-    for dirpath, dirs, files in os.walk(root):
-        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-        for name in files:
-            if name.endswith(".sdoc"):
-                results.append(Path(dirpath) / name)
-    return sorted(results)
+def _isfile_cached(path: str) -> bool:
+    # Misses are kept too, so the manifest cache can watch for stylesheets
+    # that are created later, wherever they live.
+    cached = _style_candidates.get(path)
+    if cached is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            cached = (False, None)
+        else:
+            cached = (stat.S_ISREG(st.st_mode), (st.st_mtime_ns, st.st_size))
+        _style_candidates[path] = cached
+    return cached[0]
+
+
+def load_config_chain(file_path: str, root_dir: str) -> Dict:
+    # Cached per directory; callers must treat the result as read-only.
+    return _config_for_dir(os.path.dirname(file_path), root_dir)
+
+
+def _should_descend(entry: os.DirEntry) -> bool:
+    name = entry.name
+    return name[0] != "." and name not in EXCLUDE_DIRS and not entry.is_symlink()
+
+
+def iter_sdoc_files(root: Path) -> Iterator[str]:
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir():
+                    if _should_descend(entry):
+                        stack.append(entry.path)
+                elif entry.name.endswith(".sdoc"):
+                    yield entry.path
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def tree_signature(root: Path) -> FrozenSet[Tuple]:
+    # Stat-only fingerprint of the walked tree: directory mtimes catch added,
+    # removed and renamed entries, file stats catch edited documents and configs.
+    signature = set()
+    stack = [str(root)]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            it = os.scandir(dir_path)
+        except OSError:
+            continue
+        signature.add((dir_path, _stat_key(dir_path)))
+        with it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir():
+                    if _should_descend(entry):
+                        stack.append(entry.path)
+                elif name.endswith(".sdoc") or name == CONFIG_FILENAME:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    signature.add((entry.path, (st.st_mtime_ns, st.st_size)))
+    return frozenset(signature)
+
+
+def collect_sdoc_files(root: Path) -> List[str]:
+    # Compare by components, matching Path ordering ("a/y" before "a-b/x")
+    return sorted(iter_sdoc_files(root), key=lambda p: p.split(os.sep))
 
 
 def choose_root_doc(docs: List[Dict]) -> Optional[str]:
     if not docs:
         return None
     preferred_names = {"index.sdoc", "readme.sdoc"}
-    candidates = [doc for doc in docs if Path(doc["path"]).name.lower() in preferred_names]
+    candidates = [doc for doc in docs if doc["path"].rpartition("/")[2].lower() in preferred_names]
     pool = candidates if candidates else docs
-
-    def sort_key(doc: Dict) -> Tuple[int, str]:
-        parts = doc["path"].split("/")
-        return (len(parts), doc["path"])
-
-    return sorted(pool, key=sort_key)[0]["id"]
+    return min(pool, key=lambda doc: (doc["path"].count("/"), doc["path"]))["id"]
 
 
-def build_css_map(paths: List[Path], root: Path) -> Dict[str, str]:
+def build_css_map(paths: Iterable[str], root: str) -> Dict[str, str]:
     css_map: Dict[str, str] = {}
     for p in paths:
         rel = rel_posix(p, root)
         if not rel:
             continue
-        if rel in css_map:
-            continue
         try:
             css_map[rel] = read_text(p)
         except OSError:
@@ -284,61 +396,81 @@ def build_css_map(paths: List[Path], root: Path) -> Dict[str, str]:
     return css_map
 
 
+def _try_add_style(style_path: str, source_dir: str, css_paths: List[str]) -> Optional[str]:
+    if not _isfile_cached(style_path):
+        return None
+    css_paths.append(style_path)
+    return rel_posix(style_path, source_dir)
+
+
+def _process_doc(sdoc_path: str, source_dir: str) -> Optional[Tuple[Dict, List[str]]]:
+    rp = rel_posix(sdoc_path, source_dir)
+    if not rp:
+        return None
+
+    title, meta_style, meta_append = scan_sdoc_file(sdoc_path)
+
+    config = load_config_chain(sdoc_path, source_dir)
+    css_paths: List[str] = []
+    style_key = None
+    style_append_keys: List[str] = []
+
+    if config.get("style"):
+        style_key = _try_add_style(config["style"], source_dir, css_paths)
+
+    for style_path in config.get("styleAppend", []):
+        key = _try_add_style(style_path, source_dir, css_paths)
+        if key:
+            style_append_keys.append(key)
+
+    doc_dir_path = os.path.dirname(sdoc_path)
+    for meta_item in ([meta_style] if meta_style else []) + meta_append:
+        _try_add_style(os.path.normpath(os.path.join(doc_dir_path, meta_item)), source_dir, css_paths)
+
+    doc = {
+        "id": rp,
+        "path": rp,
+        "dir": rp.rpartition("/")[0],
+        "title": title,
+        "config": {
+            "header": config.get("header", ""),
+            "footer": config.get("footer", ""),
+            "styleKey": style_key,
+            "styleAppendKeys": style_append_keys
+        }
+    }
+    return doc, css_paths
+
+
 def build_manifest(source_dir: Path) -> Dict:
     source_dir = source_dir.resolve()
+    root = str(source_dir)
+    _config_for_dir.cache_clear()
+    _style_candidates.clear()
     docs = []
-    css_paths: List[Path] = []
+    # Insertion-ordered set, so cssMap keys follow first use across documents
+    css_paths: Dict[str, None] = {}
 
-    for sdoc_path in collect_sdoc_files(source_dir):
-        content = read_text(sdoc_path)
-        title = extract_title(content)
-        rp = rel_posix(sdoc_path, source_dir)
-        if not rp:
+    sdoc_files = collect_sdoc_files(source_dir)
+    if len(sdoc_files) < PARALLEL_MIN_FILES:
+        results = list(map(_process_doc, sdoc_files, repeat(root)))
+    else:
+        # Reads overlap across threads; results come back in file order.
+        # The work is mostly blocking I/O, so allow more threads than cores.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            results = list(executor.map(_process_doc, sdoc_files, repeat(root)))
+
+    for result in results:
+        if result is None:
             continue
+        doc, doc_css_paths = result
+        docs.append(doc)
+        css_paths.update(dict.fromkeys(doc_css_paths))
+
+    for stale in _doc_cache.keys() - set(sdoc_files):
+        del _doc_cache[stale]
 
-        config = load_config_chain(sdoc_path, source_dir)
-        style_key = None
-        style_append_keys: List[str] = []
-
-        if config.get("style"):
-            style_path = Path(config["style"])
-            if style_path.exists():
-                css_paths.append(style_path)
-                style_key = rel_posix(style_path, source_dir)
-
-        for item in config.get("styleAppend", []):
-            style_path = Path(item)
-            if style_path.exists():
-                css_paths.append(style_path)
-                key = rel_posix(style_path, source_dir)
-                if key:
-                    style_append_keys.append(key)
-
-        meta_style, meta_append = extract_meta_style_paths(content)
-        if meta_style:
-            style_path = (sdoc_path.parent / meta_style).resolve()
-            if style_path.exists():
-                css_paths.append(style_path)
-        for meta_item in meta_append:
-            style_path = (sdoc_path.parent / meta_item).resolve()
-            if style_path.exists():
-                css_paths.append(style_path)
-
-        doc_dir = Path(rp).parent.as_posix()
-        docs.append({
-            "id": rp,
-            "path": rp,
-            "dir": "" if doc_dir == "." else doc_dir,
-            "title": title,
-            "config": {
-                "header": config.get("header", ""),
-                "footer": config.get("footer", ""),
-                "styleKey": style_key,
-                "styleAppendKeys": style_append_keys
-            }
-        })
-
-    css_map = build_css_map(css_paths, source_dir)
+    css_map = build_css_map(css_paths, root)
     root_doc_id = choose_root_doc(docs)
 
     return {
@@ -350,8 +482,15 @@ def build_manifest(source_dir: Path) -> Dict:
 
 class SdocHandler(http.server.BaseHTTPRequestHandler):
     source_dir: Path
+    # Resolved source_dir with a trailing separator, for containment checks
+    source_dir_str: str
     template_dir: Path
     sdoc_js_path: Path
+    # (tree signature, stats of every candidate stylesheet, encoded manifest)
+    _manifest_cache: Optional[Tuple[FrozenSet[Tuple], Dict[str, Optional[Tuple[int, int]]], bytes]] = None
+    # Requests run on their own threads; builds share module-level caches, so
+    # only one thread checks or rebuilds the manifest at a time.
+    _manifest_lock = threading.Lock()
 
     def log_message(self, format, *args):
         # Quieter logging: just method + path
@@ -365,6 +504,8 @@ class SdocHandler(http.server.BaseHTTPRequestHandler):
             self._serve_file(self.template_dir / "index.html", "text/html")
         elif pathname == "/viewer.css":
             self._serve_file(self.template_dir / "viewer.css", "text/css")
+        elif pathname == "/viewer.js":
+            self._serve_file(self.template_dir / "viewer.js", "application/javascript")
         elif pathname == "/sdoc-web.js":
             self._serve_sdoc_web_js()
         elif pathname == "/api/manifest":
@@ -395,30 +536,58 @@ class SdocHandler(http.server.BaseHTTPRequestHandler):
 
     def _serve_file(self, file_path: Path, content_type: str):
         try:
-            data = file_path.read_bytes()
+            f = open(file_path, "rb")
+        except OSError:
+            self.send_error(500, "Internal server error")
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
             self.send_response(200)
             self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(size))
             self.end_headers()
-            self.wfile.write(data)
-        except OSError:
-            self.send_error(500, "Internal server error")
+            # Headers are already on the wire (wfile is unbuffered); socket.sendfile
+            # uses os.sendfile where available and falls back to send() otherwise.
+            self.connection.sendfile(f, 0, size)
 
     def _serve_sdoc_web_js(self):
         try:
-            source = read_text(self.sdoc_js_path)
-            source = source.replace("module.exports = {", "window.SDOC = {")
-            self.send_response(200)
-            self.send_header("Content-Type", "application/javascript")
-            self.end_headers()
-            self.wfile.write(source.encode("utf-8"))
+            st = os.stat(self.sdoc_js_path)
+            data = _sdoc_web_js_bytes(str(self.sdoc_js_path), st.st_mtime_ns, st.st_size)
         except OSError:
             self.send_error(500, "Could not read sdoc.js")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/javascript")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _manifest_bytes(self) -> bytes:
+        with SdocHandler._manifest_lock:
+            return self._manifest_bytes_locked()
+
+    def _manifest_bytes_locked(self) -> bytes:
+        signature = tree_signature(self.source_dir)
+        cached = SdocHandler._manifest_cache
+        if cached is not None:
+            cached_signature, css_stats, data = cached
+            if cached_signature == signature and all(
+                _stat_key(path) == key for path, key in css_stats.items()
+            ):
+                return data
 
-    def _serve_manifest(self):
         manifest = build_manifest(self.source_dir)
-        data = json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+        data = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        css_stats = {path: key for path, (_, key) in _style_candidates.items()}
+        SdocHandler._manifest_cache = (signature, css_stats, data)
+        return data
+
+    def _serve_manifest(self):
+        data = self._manifest_bytes()
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
 
@@ -427,24 +596,28 @@ class SdocHandler(http.server.BaseHTTPRequestHandler):
             self.send_error(400, "Missing path parameter")
             return
 
-        # Path traversal protection
-        resolved = (self.source_dir / rel_path).resolve()
-        if not str(resolved).startswith(str(self.source_dir.resolve())):
+        # Path traversal protection; the trailing separator keeps /srv/docs2
+        # from passing as a child of /srv/docs
+        resolved = os.path.realpath(os.path.join(self.source_dir_str, rel_path))
+        if not resolved.startswith(self.source_dir_str):
             self.send_error(403, "Forbidden")
             return
 
-        if not str(resolved).endswith(".sdoc"):
+        if not resolved.endswith(".sdoc"):
             self.send_error(403, "Forbidden")
             return
 
         try:
-            content = resolved.read_text(encoding="utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/plain")
-            self.end_headers()
-            self.wfile.write(content.encode("utf-8"))
+            st = os.stat(resolved)
+            data = _read_sdoc_bytes(resolved, st.st_mtime_ns, st.st_size)
         except OSError:
             self.send_error(404, "File not found")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
 
 
 def main():
@@ -478,19 +651,20 @@ def main():
     sdoc_js_path = find_sdoc_js(source_dir)
     template_dir = find_site_template_dir(source_dir)
 
-    # Check for .sdoc files
-    sdoc_files = collect_sdoc_files(source_dir)
-    if not sdoc_files:
+    # Check for .sdoc files; stop at the first one rather than walking the whole tree
+    if next(iter_sdoc_files(source_dir), None) is None:
         print("No .sdoc files found.", file=sys.stderr)
         sys.exit(1)
 
     SdocHandler.source_dir = source_dir
+    SdocHandler.source_dir_str = os.path.join(str(source_dir), "")
     SdocHandler.template_dir = template_dir
     SdocHandler.sdoc_js_path = sdoc_js_path
 
-    server = http.server.HTTPServer(("", args.port), SdocHandler)
+    server = http.server.ThreadingHTTPServer(("", args.port), SdocHandler)
+    server.daemon_threads = True
     url = f"http://localhost:{args.port}"
-    print(f"Serving {len(sdoc_files)} documents from {source_dir}")
+    print(f"Serving documents from {source_dir}")
     print(f"  {url}")
     print("Press Ctrl+C to stop.")
 